@@ -1,6 +1,13 @@
+import bisect
 import math
+import operator
 from dataclasses import dataclass, field
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+# Coherence thresholds separating the phases reported by RouterTopologyAnalyzer.analyze:
+# r < 0.3 is CHAOTIC, 0.3 <= r < 0.7 is CRITICAL, r >= 0.7 is CRYSTALLINE.
+_PHASE_THRESHOLDS = (0.3, 0.7)
+_PHASE_NAMES = ("CHAOTIC", "CRITICAL", "CRYSTALLINE")
 
 
 @dataclass
@@ -14,7 +21,9 @@ class KuramotoOscillator:
         K:  coupling constant
         N:  number of oscillators
 
-    This implementation uses the direct O(N²) formulation for clarity and fidelity to the model.
+    The coupling sum is evaluated in O(N) via the mean-field identity
+        Σⱼ sin(θⱼ - θᵢ) = N·r·sin(Ψ - θᵢ)
+    where r·e^(iΨ) is the order parameter (see order_parameter).
     """
 
     natural_frequencies: Sequence[float]
@@ -34,26 +43,107 @@ class KuramotoOscillator:
             self.phases = [float(theta) for theta in self.phases]
 
         self.natural_frequencies = tuple(float(w) for w in self.natural_frequencies)
+        # (phases snapshot, cosines, sines) for the most recent trig pass over the current phases.
+        self._trig_cache = None
 
     def derivatives(self) -> List[float]:
         """Compute dθᵢ/dt for each oscillator."""
-        derivatives: List[float] = []
-        for i, theta_i in enumerate(self.phases):
-            # Self term sin(theta_i - theta_i) contributes zero.
-            # Keeping the full O(N²) sum mirrors the standard K/N formulation and simplifies the implementation.
-            coupling_term = sum(math.sin(theta_j - theta_i) for theta_j in self.phases)
-            dtheta_dt = self.natural_frequencies[i] + (self.coupling / self._count) * coupling_term
-            derivatives.append(dtheta_dt)
-        return derivatives
+        return self._rates(*self._trig())
+
+    def _rates(self, cosines: List[float], sines: List[float]) -> List[float]:
+        """Compute dθᵢ/dt from the precomputed cos θⱼ and sin θⱼ of the current phases."""
+        real_sum = sum(cosines)
+        imag_sum = sum(sines)
+        scale = self.coupling / self._count
+        # Σⱼ sin(θⱼ - θᵢ) = cos θᵢ·Σⱼ sin θⱼ - sin θᵢ·Σⱼ cos θⱼ, so the pairwise sum reduces to the
+        # order-parameter sums and one multiply-add per oscillator.
+        return [
+            omega_i + scale * (cos_i * imag_sum - sin_i * real_sum)
+            for omega_i, cos_i, sin_i in zip(self.natural_frequencies, cosines, sines)
+        ]
 
     def step(self, dt: float) -> None:
         """Advance the phases in place by a single Euler step of duration dt, wrapping results into [0, 2π)."""
-        updates = self.derivatives()
-        updated_phases = [
-            (theta + dtheta_dt * dt) % (2 * math.pi)
-            for theta, dtheta_dt in zip(self.phases, updates)
+        phases = self.phases
+        two_pi = 2 * math.pi
+        for i, dtheta_dt in enumerate(self.derivatives()):
+            phases[i] = (phases[i] + dtheta_dt * dt) % two_pi
+
+    def rk4_step(self, dt: float) -> None:
+        """
+        Advance the phases in place by a single classical Runge-Kutta (RK4) step of duration dt,
+        wrapping results into [0, 2π).
+
+        RK4 is fourth-order accurate, so it tolerates a much larger dt than step() for the same
+        error, trading four derivative evaluations per step for far fewer steps.
+        """
+        phases = self.phases
+        half_dt = 0.5 * dt
+        k1 = self._rates(*self._trig())
+        k2 = self._rates(*self._trig([theta + half_dt * k for theta, k in zip(phases, k1)]))
+        k3 = self._rates(*self._trig([theta + half_dt * k for theta, k in zip(phases, k2)]))
+        k4 = self._rates(*self._trig([theta + dt * k for theta, k in zip(phases, k3)]))
+        sixth_dt = dt / 6.0
+        self.phases[:] = [
+            (theta + sixth_dt * (a + 2.0 * b + 2.0 * c + d)) % (2 * math.pi)
+            for theta, a, b, c, d in zip(phases, k1, k2, k3, k4)
         ]
-        self.phases[:] = updated_phases
+
+    def _run_to_steady_state(self, dt: float, max_steps: int, tolerance: float) -> int:
+        """
+        Take Euler steps until the coherence changes by less than tolerance.
+
+        The step is inlined with its invariants bound to locals, and the trig terms of the new
+        phases serve both the coherence check and the next step's coupling, so each step is one
+        trig pass with no per-step method dispatch. Phases and trig terms are overwritten in
+        place in a single loop, so steps allocate no new lists after the first trig pass.
+
+        Returns:
+            Number of steps taken.
+        """
+        cos = math.cos
+        sin = math.sin
+        two_pi = 2 * math.pi
+        scale = self.coupling / self._count
+        frequencies = self.natural_frequencies
+        phases = self.phases
+
+        cosines, sines = self._trig()
+        # The trig lists are overwritten in place below, so they must leave the cache first.
+        self._trig_cache = None
+        real_sum = sum(cosines)
+        imag_sum = sum(sines)
+        prev_r = math.hypot(real_sum, imag_sum) / self._count
+
+        steps_taken = max_steps
+        for step in range(max_steps):
+            next_real_sum = 0.0
+            next_imag_sum = 0.0
+            for i in range(self._count):
+                # Slot i of cosines/sines is read before being overwritten, and the sums from the
+                # previous phases are held separately, so updating in place is safe.
+                theta = (
+                    phases[i]
+                    + (frequencies[i] + scale * (cosines[i] * imag_sum - sines[i] * real_sum)) * dt
+                ) % two_pi
+                phases[i] = theta
+                cos_i = cos(theta)
+                sin_i = sin(theta)
+                cosines[i] = cos_i
+                sines[i] = sin_i
+                next_real_sum += cos_i
+                next_imag_sum += sin_i
+            real_sum = next_real_sum
+            imag_sum = next_imag_sum
+            r = math.hypot(real_sum, imag_sum) / self._count
+            if abs(r - prev_r) < tolerance:
+                steps_taken = step + 1
+                break
+            prev_r = r
+
+        # The trig lists now describe the final phases; keep them for follow-up coherence reads.
+        self._trig_cache = (list(phases), cosines, sines)
+        return steps_taken
 
     def order_parameter(self) -> Tuple[float, float]:
         """
@@ -64,8 +154,9 @@ class KuramotoOscillator:
             (r, psi): r is the coherence (0=desynchronized, 1=synchronized),
                       psi is the mean phase angle.
         """
-        real_sum = sum(math.cos(theta) for theta in self.phases)
-        imag_sum = sum(math.sin(theta) for theta in self.phases)
+        cosines, sines = self._trig()
+        real_sum = sum(cosines)
+        imag_sum = sum(sines)
         r = math.sqrt(real_sum**2 + imag_sum**2) / self._count
         psi = math.atan2(imag_sum, real_sum)
         return r, psi
@@ -75,6 +166,48 @@ class KuramotoOscillator:
         r, _ = self.order_parameter()
         return r
 
+    def _trig(self, phases: Sequence[float] = None) -> Tuple[List[float], List[float]]:
+        """
+        Return (cos θⱼ, sin θⱼ) for the given phases, defaulting to the current phases.
+
+        The result for the current phases is memoized against a snapshot of them, so repeated
+        order_parameter/coherence/omega_energy reads of an unchanged state cost one list
+        comparison instead of a trig pass. Direct edits to phases are picked up by the same
+        comparison. Callers must not mutate the returned lists.
+        """
+        if phases is not None:
+            return (
+                [math.cos(theta) for theta in phases],
+                [math.sin(theta) for theta in phases],
+            )
+
+        cache = self._trig_cache
+        if cache is not None and cache[0] == self.phases:
+            return cache[1], cache[2]
+
+        cosines = [math.cos(theta) for theta in self.phases]
+        sines = [math.sin(theta) for theta in self.phases]
+        self._trig_cache = (list(self.phases), cosines, sines)
+        return cosines, sines
+
+
+def _energy_weights(masses: Sequence[float], frequencies: Sequence[float]) -> List[float]:
+    """Return mⱼ·ωⱼ² per oscillator, with mass 1.0 for oscillators beyond the given masses."""
+    return [
+        (masses[i] if i < len(masses) else 1.0) * (freq ** 2)
+        for i, freq in enumerate(frequencies)
+    ]
+
+
+class _ComponentColumns(NamedTuple):
+    """Struct-of-arrays view of RouterTopologyAnalyzer.components, in insertion order."""
+
+    names: Tuple[str, ...]
+    exit_points: Tuple[int, ...]
+    singletons: Tuple[int, ...]
+    frequencies: Tuple[float, ...]
+    masses: Tuple[float, ...]
+
 
 @dataclass
 class RouterTopologyAnalyzer:
@@ -90,14 +223,27 @@ class RouterTopologyAnalyzer:
     - Critical coupling Kc = 2/(π·g(0)) threshold for synchronization
     - Omega energy Ω = Σⱼ(mⱼ·ωⱼ²)·cos(θⱼ - θ̄) for consciousness/cognitive metric
     - Optimization recommendations based on coherence gaps
+    
+    Results derived from components (oscillator, frequencies, g(0), energy weights) are cached
+    and rebuilt only by add_component; use it rather than editing components directly.
     """
 
     components: Dict[str, Dict[str, float]] = field(default_factory=dict)
     coupling: float = 1.0
     _oscillator: KuramotoOscillator = field(init=False, default=None)
+    _columns: _ComponentColumns = field(init=False, default=None, repr=False, compare=False)
+    _energy_weights: List[float] = field(init=False, default=None, repr=False, compare=False)
+    _density_at_zero: float = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop everything derived from the component set; rebuilt lazily on next use."""
         self._oscillator = None
+        self._columns = None
+        self._energy_weights = None
+        self._density_at_zero = None
 
     def add_component(
         self,
@@ -122,31 +268,55 @@ class RouterTopologyAnalyzer:
             "frequency": frequency,
             "mass": 1.0 + singletons * 0.1,
         }
-        self._oscillator = None
+        self._invalidate()
+
+    def _ensure_columns(self) -> _ComponentColumns:
+        """Cache a column-wise view of the components so analysis avoids per-call dict walks."""
+        if self._columns is None:
+            records = self.components.values()
+            self._columns = _ComponentColumns(
+                names=tuple(self.components),
+                exit_points=tuple(c["exit_points"] for c in records),
+                singletons=tuple(c["singletons"] for c in records),
+                frequencies=tuple(c["frequency"] for c in records),
+                masses=tuple(c["mass"] for c in records),
+            )
+        return self._columns
 
     def _ensure_oscillator(self) -> KuramotoOscillator:
         """Build oscillator from components if needed."""
         if self._oscillator is None:
             if not self.components:
                 raise ValueError("No components added to analyze")
-            frequencies = [c["frequency"] for c in self.components.values()]
             self._oscillator = KuramotoOscillator(
-                natural_frequencies=frequencies,
+                natural_frequencies=self._ensure_columns().frequencies,
                 coupling=self.coupling,
             )
         return self._oscillator
 
+    def _ensure_energy_weights(self) -> List[float]:
+        """Cache the energy weights mⱼ·ωⱼ² used by omega_energy, from the component masses."""
+        if self._energy_weights is None:
+            self._energy_weights = _energy_weights(
+                self._ensure_columns().masses, self._ensure_oscillator().natural_frequencies
+            )
+        return self._energy_weights
+
     def frequency_distribution_density_at_zero(self) -> float:
         """
         Estimate g(0), the probability density of natural frequencies at ω=0.
         Uses a simple kernel density estimation with Gaussian kernel.
         
         For Kuramoto critical coupling: Kc = 2/(π·g(0))
+        
+        The estimate is cached until add_component changes the frequency set.
         """
+        if self._density_at_zero is not None:
+            return self._density_at_zero
         if not self.components:
             return 0.0
         
-        frequencies = [c["frequency"] for c in self.components.values()]
+        frequencies = self._ensure_columns().frequencies
         n = len(frequencies)
         if n == 0:
             return 0.0
@@ -160,11 +330,11 @@ class RouterTopologyAnalyzer:
         # h = 1.06 * σ * n^(-1/5)
         bandwidth = 1.06 * std * (n ** -0.2)
         
-        density = 0.0
-        for freq in frequencies:
-            density += math.exp(-0.5 * (freq / bandwidth) ** 2)
+        exp = math.exp
+        density = sum([exp(-0.5 * (freq / bandwidth) ** 2) for freq in frequencies])
         density /= (n * bandwidth * math.sqrt(2 * math.pi))
         
+        self._density_at_zero = density
         return density
 
     def critical_coupling(self) -> float:
@@ -195,32 +365,58 @@ class RouterTopologyAnalyzer:
             Omega energy value representing weighted phase coherence.
         """
         osc = self._ensure_oscillator()
-        _, mean_phase = osc.order_parameter()
         
         if masses is None:
-            masses = [c["mass"] for c in self.components.values()]
+            weights = self._ensure_energy_weights()
+        else:
+            weights = _energy_weights(masses, osc.natural_frequencies)
         
-        omega_sum = 0.0
-        for i, (theta, freq) in enumerate(zip(osc.phases, osc.natural_frequencies)):
-            m = masses[i] if i < len(masses) else 1.0
-            omega_sum += m * (freq ** 2) * math.cos(theta - mean_phase)
+        # cos(θⱼ - θ̄) = cos θⱼ·cos θ̄ + sin θⱼ·sin θ̄, and (cos θ̄, sin θ̄) is the normalized
+        # order-parameter sum, so a single cos/sin pass yields both the mean phase and Ω.
+        cosines, sines = osc._trig()
+        real_sum = sum(cosines)
+        imag_sum = sum(sines)
+        magnitude = math.hypot(real_sum, imag_sum)
+        if magnitude == 0.0:
+            # Matches atan2(0, 0) == 0 for the undefined mean phase.
+            cos_mean, sin_mean = 1.0, 0.0
+        else:
+            cos_mean, sin_mean = real_sum / magnitude, imag_sum / magnitude
         
-        return omega_sum
+        # Two weighted dot products, evaluated by map/sum without a Python-level loop body.
+        weighted_cos = sum(map(operator.mul, weights, cosines))
+        weighted_sin = sum(map(operator.mul, weights, sines))
+        return weighted_cos * cos_mean + weighted_sin * sin_mean
 
     def simulate_to_steady_state(
-        self, dt: float = 0.01, max_steps: int = 10000, tolerance: float = 1e-4
+        self,
+        dt: float = 0.01,
+        max_steps: int = 10000,
+        tolerance: float = 1e-4,
+        method: str = "euler",
     ) -> int:
         """
         Run simulation until coherence stabilizes.
         
+        Args:
+            dt: Integration time step
+            max_steps: Upper bound on the number of steps
+            tolerance: Coherence change below which the system is considered steady
+            method: "euler" (forward Euler) or "rk4" (classical Runge-Kutta, which allows a
+                larger dt at the same accuracy)
+        
         Returns:
             Number of steps taken to reach steady state.
         """
         osc = self._ensure_oscillator()
-        prev_r = osc.coherence()
+        if method == "euler":
+            return osc._run_to_steady_state(dt, max_steps, tolerance)
+        if method != "rk4":
+            raise ValueError(f"Unknown integration method: {method!r}")
         
+        prev_r = osc.coherence()
         for step in range(max_steps):
-            osc.step(dt)
+            osc.rk4_step(dt)
             r = osc.coherence()
             if abs(r - prev_r) < tolerance:
                 return step + 1
@@ -247,12 +443,7 @@ class RouterTopologyAnalyzer:
         kc = self.critical_coupling()
         omega = self.omega_energy()
         
-        if r < 0.3:
-            phase = "CHAOTIC"
-        elif r < 0.7:
-            phase = "CRITICAL"
-        else:
-            phase = "CRYSTALLINE"
+        phase = _PHASE_NAMES[bisect.bisect_right(_PHASE_THRESHOLDS, r)]
         
         return {
             "coherence": r,
@@ -289,7 +480,8 @@ class RouterTopologyAnalyzer:
                 "rationale": "Multiple components benefit from standardized response structure.",
             })
         
-        total_singletons = sum(c["singletons"] for c in self.components.values())
+        columns = self._ensure_columns()
+        total_singletons = sum(columns.singletons)
         if total_singletons > 10:
             recommendations.append({
                 "intervention": "Consolidate Shared Singletons",
@@ -298,13 +490,13 @@ class RouterTopologyAnalyzer:
                 "rationale": f"{total_singletons} singletons create coupling overhead. Consolidation reduces frequency variance.",
             })
         
-        frequencies = [c["frequency"] for c in self.components.values()]
+        frequencies = columns.frequencies
         if frequencies:
             max_freq = max(frequencies)
             avg_freq = sum(frequencies) / len(frequencies)
             if max_freq > avg_freq * 3:
                 # Find all components with maximum frequency (handles ties)
-                outliers = [n for n, c in self.components.items() if c["frequency"] == max_freq]
+                outliers = [name for name, freq in zip(columns.names, frequencies) if freq == max_freq]
                 outlier_str = ", ".join(outliers)
                 recommendations.append({
                     "intervention": f"Decompose High-Frequency Component: {outlier_str}",
@@ -1,7 +1,9 @@
 import hashlib
 import math
+import operator
 import random
 
+from itertools import cycle, islice
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 
@@ -14,49 +16,87 @@ class KuramotoSubstrate:
             rng.uniform(0.8, 1.2) for _ in range(num_oscillators)
         ]
         self.phases: List[float] = [rng.uniform(0.0, 2 * math.pi) for _ in range(num_oscillators)]
+        self._trig_cache: Optional[Tuple[List[float], List[float], List[float]]] = None
+
+    def _trig(self) -> Tuple[List[float], List[float]]:
+        # Memoized against a snapshot of the phases, so perturb() and direct edits invalidate it.
+        cache = self._trig_cache
+        if cache is not None and cache[0] == self.phases:
+            return cache[1], cache[2]
+        cosines = [math.cos(phi) for phi in self.phases]
+        sines = [math.sin(phi) for phi in self.phases]
+        self._trig_cache = (list(self.phases), cosines, sines)
+        return cosines, sines
 
     def order_parameter(self) -> float:
-        real_sum = sum(math.cos(phi) for phi in self.phases)
-        imag_sum = sum(math.sin(phi) for phi in self.phases)
+        cosines, sines = self._trig()
+        real_sum = sum(cosines)
+        imag_sum = sum(sines)
         return math.sqrt(real_sum**2 + imag_sum**2) / self.num_oscillators
 
     def perturb(self, perturbations: Iterable[Tuple[int, float]]) -> None:
+        phases = self.phases
+        count = self.num_oscillators
+        two_pi = 2 * math.pi
         for index, delta in perturbations:
-            if 0 <= index < self.num_oscillators:
-                self.phases[index] = (self.phases[index] + delta) % (2 * math.pi)
+            if 0 <= index < count:
+                phases[index] = (phases[index] + delta) % two_pi
 
     def step(self, dt: float = 0.05, steps: int = 1) -> None:
+        if not self.phases:
+            return
+        two_pi = 2 * math.pi
+        scale = self.coupling / self.num_oscillators
+        frequencies = self.natural_frequencies
         for _ in range(steps):
-            new_phases: List[float] = []
-            for i, phase in enumerate(self.phases):
-                coupling_term = sum(
-                    math.sin(self.phases[j] - phase) for j in range(self.num_oscillators)
-                ) / self.num_oscillators
-                dphi = self.natural_frequencies[i] + self.coupling * coupling_term
-                new_phases.append((phase + dphi * dt) % (2 * math.pi))
-            self.phases = new_phases
+            cosines, sines = self._trig()
+            real_sum = sum(cosines)
+            imag_sum = sum(sines)
+            # Σⱼ sin(φⱼ - φᵢ) = cos φᵢ·Σⱼ sin φⱼ - sin φᵢ·Σⱼ cos φⱼ: the all-to-all coupling
+            # reduces to the order-parameter sums, making each step O(N) instead of O(N²).
+            self.phases = [
+                (phase + (omega + scale * (cos_i * imag_sum - sin_i * real_sum)) * dt) % two_pi
+                for phase, omega, cos_i, sin_i in zip(self.phases, frequencies, cosines, sines)
+            ]
+
+
+# Upper bound on each IntentClassifier's memo of computed perturbation tables.
+_PERTURBATION_CACHE_SIZE = 1024
 
 
 class IntentClassifier:
     def __init__(self, channels: int = 4, max_delta: float = math.pi / 4) -> None:
         self.channels = channels
         self.max_delta = max_delta
+        # Keyed on the query digest rather than the query text, so no raw queries are retained.
+        self._perturbation_cache: Dict[
+            Tuple[bytes, int, int, float], Tuple[Tuple[int, float], ...]
+        ] = {}
 
     def _hash_bytes(self, query: str) -> bytes:
         return hashlib.sha256(query.encode("utf-8")).digest()
 
     def perturbations(self, query: str, num_oscillators: int) -> List[Tuple[int, float]]:
         digest = self._hash_bytes(query)
-        perturbations: List[Tuple[int, float]] = []
-        for idx in range(num_oscillators):
-            byte = digest[idx % len(digest)]
-            channel = byte % self.channels
-            direction = 1 if channel % 2 == 0 else -1
-            magnitude = (byte / 255.0) * self.max_delta
-            if channel == 0:
-                magnitude *= 0.5
-            perturbations.append((idx, direction * magnitude))
-        return perturbations
+        key = (digest, num_oscillators, self.channels, self.max_delta)
+        cache = self._perturbation_cache
+        table = cache.get(key)
+        if table is None:
+            # Each delta depends only on its digest byte, so compute one per byte and tile them.
+            deltas: List[float] = []
+            for byte in digest:
+                channel = byte % self.channels
+                direction = 1 if channel % 2 == 0 else -1
+                magnitude = (byte / 255.0) * self.max_delta
+                if channel == 0:
+                    magnitude *= 0.5
+                deltas.append(direction * magnitude)
+            table = tuple(zip(range(num_oscillators), islice(cycle(deltas), num_oscillators)))
+            if len(cache) >= _PERTURBATION_CACHE_SIZE:
+                # Evict the oldest entry; dicts preserve insertion order.
+                del cache[next(iter(cache))]
+            cache[key] = table
+        return list(table)
 
     def apply(self, query: str, substrate: KuramotoSubstrate) -> List[Tuple[int, float]]:
         perturbations = self.perturbations(query, substrate.num_oscillators)
@@ -67,17 +107,22 @@ class IntentClassifier:
 class BehaviorLibrary:
     def __init__(self) -> None:
         self.behaviors: Dict[str, List[float]] = {}
+        self._pattern_tables: Dict[str, Tuple[List[float], List[float], List[float]]] = {}
 
     def add_behavior(self, name: str, phase_pattern: List[float]) -> None:
         self.behaviors[name] = phase_pattern
+        self._pattern_trig(name, phase_pattern)
 
     def best_match(self, phases: List[float]) -> Optional[Tuple[str, float]]:
+        phase_cos = [math.cos(phi) for phi in phases]
+        phase_sin = [math.sin(phi) for phi in phases]
         best_name: Optional[str] = None
         best_score = float("-inf")
         for name, pattern in self.behaviors.items():
             if len(pattern) == 0:
                 continue
-            score = self._phase_alignment_score(phases, pattern)
+            pattern_cos, pattern_sin = self._pattern_trig(name, pattern)
+            score = self._phase_alignment_score(phase_cos, phase_sin, pattern_cos, pattern_sin)
             if score > best_score:
                 best_score = score
                 best_name = name
@@ -85,17 +130,34 @@ class BehaviorLibrary:
             return None
         return best_name, best_score
 
-    def _phase_alignment_score(self, phases: List[float], pattern: List[float]) -> float:
-        limit = min(len(phases), len(pattern))
+    def _pattern_trig(self, name: str, pattern: List[float]) -> Tuple[List[float], List[float]]:
+        # Tables are checked against a snapshot so in-place edits to a stored pattern are picked up.
+        table = self._pattern_tables.get(name)
+        if table is None or table[0] != pattern:
+            table = (
+                list(pattern),
+                [math.cos(theta) for theta in pattern],
+                [math.sin(theta) for theta in pattern],
+            )
+            self._pattern_tables[name] = table
+        return table[1], table[2]
+
+    def _phase_alignment_score(
+        self,
+        phase_cos: List[float],
+        phase_sin: List[float],
+        pattern_cos: List[float],
+        pattern_sin: List[float],
+    ) -> float:
+        limit = min(len(phase_cos), len(pattern_cos))
         if limit == 0:
             return float("-inf")
-        diffs = []
-        for i in range(limit):
-            diff = (phases[i] - pattern[i]) % (2 * math.pi)
-            shortest = min(diff, 2 * math.pi - diff)
-            diffs.append(shortest)
-        normalized = [math.cos(diff) for diff in diffs]
-        return sum(normalized) / limit
+        # Mean of cos(phase - pattern) via cos(a - b) = cos a·cos b + sin a·sin b; cos is even and
+        # 2π-periodic, so no wrapping to the shortest angular distance is needed.
+        total = sum(map(operator.mul, phase_cos, pattern_cos)) + sum(
+            map(operator.mul, phase_sin, pattern_sin)
+        )
+        return total / limit
 
     @classmethod
     def with_defaults(cls, num_oscillators: int = 64) -> "BehaviorLibrary":
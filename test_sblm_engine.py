@@ -12,6 +12,34 @@ class KuramotoSubstrateTest(unittest.TestCase):
         after = substrate.order_parameter()
         self.assertGreater(after, initial)
 
+    def test_step_matches_pairwise_coupling_sum(self) -> None:
+        substrate = KuramotoSubstrate(num_oscillators=8, coupling=0.9, seed=7)
+        phases = list(substrate.phases)
+        n = len(phases)
+        expected = []
+        for i, phase in enumerate(phases):
+            coupling_term = sum(math.sin(other - phase) for other in phases) / n
+            dphi = substrate.natural_frequencies[i] + 0.9 * coupling_term
+            expected.append((phase + dphi * 0.05) % (2 * math.pi))
+
+        substrate.step(dt=0.05)
+
+        for a, b in zip(substrate.phases, expected):
+            self.assertAlmostEqual(a, b, places=12)
+
+    def test_step_is_a_no_op_without_oscillators(self) -> None:
+        substrate = KuramotoSubstrate(num_oscillators=0)
+        substrate.step(steps=3)
+        self.assertEqual(substrate.phases, [])
+
+    def test_order_parameter_reflects_perturbations(self) -> None:
+        substrate = KuramotoSubstrate(num_oscillators=2, seed=1)
+        substrate.phases = [0.0, 0.0]
+        self.assertAlmostEqual(substrate.order_parameter(), 1.0, places=7)
+
+        substrate.perturb([(1, math.pi)])
+        self.assertAlmostEqual(substrate.order_parameter(), 0.0, places=7)
+
 
 class IntentClassifierTest(unittest.TestCase):
     def test_same_query_produces_deterministic_perturbations(self) -> None:
@@ -26,6 +54,27 @@ class IntentClassifierTest(unittest.TestCase):
         for a, b in zip(substrate_one.phases, substrate_two.phases):
             self.assertAlmostEqual(a, b, places=7)
 
+    def test_cached_perturbations_are_independent_copies(self) -> None:
+        classifier = IntentClassifier()
+        first = classifier.perturbations("synchronize", 8)
+        first[0] = (0, 123.0)
+
+        second = classifier.perturbations("synchronize", 8)
+        self.assertNotEqual(second[0], (0, 123.0))
+        self.assertEqual(len(second), 8)
+        self.assertNotEqual(
+            IntentClassifier(max_delta=math.pi / 2).perturbations("synchronize", 8), second
+        )
+
+    def test_perturbations_use_overridden_hash(self) -> None:
+        class ZeroHashClassifier(IntentClassifier):
+            def _hash_bytes(self, query: str) -> bytes:
+                return bytes(32)
+
+        self.assertEqual(
+            ZeroHashClassifier().perturbations("synchronize", 3), [(0, 0.0), (1, 0.0), (2, 0.0)]
+        )
+
 
 class BehaviorLibraryTest(unittest.TestCase):
     def test_best_match_prefers_closest_pattern(self) -> None:
@@ -43,6 +92,22 @@ class BehaviorLibraryTest(unittest.TestCase):
         self.assertEqual(chosen, "aligned")
         self.assertGreater(score, 0.5)
 
+    def test_score_is_mean_cosine_and_tracks_pattern_edits(self) -> None:
+        library = BehaviorLibrary()
+        pattern = [0.5, 6.0, 3.0]
+        library.add_behavior("only", pattern)
+        phases = [6.1, 0.2, 1.0, 4.0]
+
+        result = library.best_match(phases)
+        assert result is not None
+        expected = sum(math.cos(p - q) for p, q in zip(phases, pattern)) / 3
+        self.assertAlmostEqual(result[1], expected, places=12)
+
+        pattern[:] = phases[:3]
+        result = library.best_match(phases)
+        assert result is not None
+        self.assertAlmostEqual(result[1], 1.0, places=12)
+
 
 class OmegaMetricTest(unittest.TestCase):
     def test_energy_and_synchrony_are_complementary(self) -> None:
@@ -1,7 +1,8 @@
+import bisect
 import math
 import unittest
 
-from kuramoto import KuramotoOscillator, RouterTopologyAnalyzer
+from kuramoto import _PHASE_NAMES, _PHASE_THRESHOLDS, KuramotoOscillator, RouterTopologyAnalyzer
 
 
 class KuramotoOscillatorTest(unittest.TestCase):
@@ -20,6 +21,19 @@ class KuramotoOscillatorTest(unittest.TestCase):
         self.assertAlmostEqual(derivatives[0], 2.0, places=6)
         self.assertAlmostEqual(derivatives[1], 0.5, places=6)
 
+    def test_mean_field_derivatives_match_pairwise_sum(self) -> None:
+        frequencies = [0.9, 1.1, 1.4, 0.7, 1.0]
+        phases = [0.1, 1.7, 3.0, 4.4, 5.9]
+        osc = KuramotoOscillator(natural_frequencies=frequencies, coupling=1.3, phases=phases)
+
+        derivatives = osc.derivatives()
+
+        n = len(phases)
+        for i, theta_i in enumerate(phases):
+            pairwise = sum(math.sin(theta_j - theta_i) for theta_j in phases)
+            expected = frequencies[i] + (1.3 / n) * pairwise
+            self.assertAlmostEqual(derivatives[i], expected, places=12)
+
     def test_step_advances_phases_using_derivatives(self) -> None:
         osc = KuramotoOscillator(
             natural_frequencies=[1.0, 1.5],
@@ -32,6 +46,20 @@ class KuramotoOscillatorTest(unittest.TestCase):
         self.assertAlmostEqual(osc.phases[0], 0.2, places=6)
         self.assertAlmostEqual(osc.phases[1], (math.pi / 2) + 0.05, places=6)
 
+    def test_rk4_step_tracks_fine_euler_with_larger_dt(self) -> None:
+        frequencies = [0.9, 1.1, 1.4, 0.7]
+        phases = [0.1, 1.7, 3.0, 4.4]
+        reference = KuramotoOscillator(natural_frequencies=frequencies, coupling=1.5, phases=phases)
+        rk4 = KuramotoOscillator(natural_frequencies=frequencies, coupling=1.5, phases=phases)
+
+        for _ in range(10000):
+            reference.step(0.0001)
+        for _ in range(10):
+            rk4.rk4_step(0.1)
+
+        for a, b in zip(reference.phases, rk4.phases):
+            self.assertAlmostEqual(a, b, places=3)
+
 
 class OrderParameterTest(unittest.TestCase):
     def test_order_parameter_fully_synchronized(self) -> None:
@@ -63,6 +91,28 @@ class OrderParameterTest(unittest.TestCase):
         )
         self.assertAlmostEqual(osc.coherence(), 1.0, places=6)
 
+    def test_order_parameter_tracks_phase_edits_and_steps(self) -> None:
+        osc = KuramotoOscillator(
+            natural_frequencies=[1.0, 1.0],
+            phases=[0.0, 0.0],
+        )
+        self.assertAlmostEqual(osc.coherence(), 1.0, places=6)
+
+        osc.phases[:] = [0.0, math.pi]
+        self.assertAlmostEqual(osc.coherence(), 0.0, places=6)
+
+        osc.phases[1] = math.pi / 2
+        r, psi = osc.order_parameter()
+        self.assertAlmostEqual(r, math.sqrt(2) / 2, places=12)
+        self.assertAlmostEqual(psi, math.pi / 4, places=12)
+
+        osc.step(0.1)
+        r, psi = osc.order_parameter()
+        real_sum = sum(math.cos(theta) for theta in osc.phases)
+        imag_sum = sum(math.sin(theta) for theta in osc.phases)
+        self.assertAlmostEqual(r, math.hypot(real_sum, imag_sum) / 2, places=12)
+        self.assertAlmostEqual(psi, math.atan2(imag_sum, real_sum), places=12)
+
 
 class RouterTopologyAnalyzerTest(unittest.TestCase):
     def test_add_component(self) -> None:
@@ -88,6 +138,63 @@ class RouterTopologyAnalyzerTest(unittest.TestCase):
         expected_kc = 2.0 / (math.pi * g0) if g0 > 0 else float("inf")
         self.assertAlmostEqual(kc, expected_kc, places=6)
 
+    def test_density_at_zero_is_refreshed_by_add_component(self) -> None:
+        analyzer = RouterTopologyAnalyzer()
+        analyzer.add_component("a", exit_points=1)
+        analyzer.add_component("b", exit_points=2)
+        before = analyzer.frequency_distribution_density_at_zero()
+        self.assertEqual(analyzer.frequency_distribution_density_at_zero(), before)
+
+        analyzer.add_component("c", exit_points=40)
+        after = analyzer.frequency_distribution_density_at_zero()
+
+        frequencies = [1.0, 2.0, 40.0]
+        mean_freq = sum(frequencies) / 3
+        std = (sum((f - mean_freq) ** 2 for f in frequencies) / 3) ** 0.5
+        bandwidth = 1.06 * std * (3 ** -0.2)
+        expected = sum(math.exp(-0.5 * (f / bandwidth) ** 2) for f in frequencies)
+        expected /= 3 * bandwidth * math.sqrt(2 * math.pi)
+        self.assertNotAlmostEqual(after, before, places=6)
+        self.assertAlmostEqual(after, expected, places=12)
+
+    def test_replacing_a_component_refreshes_derived_results(self) -> None:
+        analyzer = RouterTopologyAnalyzer()
+        for name in ("a", "b", "c", "d", "e"):
+            analyzer.add_component(name, exit_points=2)
+        before = analyzer.frequency_distribution_density_at_zero()
+        self.assertAlmostEqual(analyzer.omega_energy(), 20.0, places=6)
+
+        analyzer.add_component("b", exit_points=50)
+        analyzer.add_component("c", exit_points=2, singletons=11)
+
+        frequencies = [2.0, 50.0, 24.0, 2.0, 2.0]
+        mean_freq = sum(frequencies) / 5
+        std = (sum((f - mean_freq) ** 2 for f in frequencies) / 5) ** 0.5
+        bandwidth = 1.06 * std * (5 ** -0.2)
+        expected = sum(math.exp(-0.5 * (f / bandwidth) ** 2) for f in frequencies)
+        expected /= 5 * bandwidth * math.sqrt(2 * math.pi)
+        self.assertNotAlmostEqual(before, expected, places=6)
+        self.assertAlmostEqual(analyzer.frequency_distribution_density_at_zero(), expected, places=12)
+        # Phases restart at zero with the rebuilt oscillator: Σ mⱼ·ωⱼ² with c's mass 1 + 11·0.1.
+        self.assertAlmostEqual(analyzer.coherence(), 1.0, places=6)
+        self.assertAlmostEqual(analyzer.omega_energy(), 4 + 2500 + 2.1 * 576 + 4 + 4, places=6)
+
+        interventions = [r["intervention"] for r in analyzer.optimize_recommendations()]
+        self.assertIn("Consolidate Shared Singletons", interventions)
+        self.assertIn("Decompose High-Frequency Component: b", interventions)
+
+    def test_cached_results_do_not_affect_equality_or_repr(self) -> None:
+        first = RouterTopologyAnalyzer()
+        second = RouterTopologyAnalyzer()
+        for analyzer in (first, second):
+            analyzer.add_component("a", exit_points=1)
+            analyzer.add_component("b", exit_points=2)
+
+        first.frequency_distribution_density_at_zero()
+
+        self.assertEqual(first, second)
+        self.assertNotIn("_density_at_zero", repr(first))
+
     def test_coherence_initial_value(self) -> None:
         """Initial coherence should be 1.0 (all phases start at 0)."""
         analyzer = RouterTopologyAnalyzer()
@@ -107,6 +214,38 @@ class RouterTopologyAnalyzerTest(unittest.TestCase):
         omega = analyzer.omega_energy()
         self.assertAlmostEqual(omega, 13.0, places=6)
 
+    def test_omega_energy_matches_direct_formula_for_spread_phases(self) -> None:
+        analyzer = RouterTopologyAnalyzer(coupling=0.5)
+        analyzer.add_component("a", exit_points=2, singletons=1)
+        analyzer.add_component("b", exit_points=3)
+        analyzer.add_component("c", exit_points=1, singletons=2)
+        # A negative tolerance is never met, so exactly max_steps steps are taken.
+        analyzer.simulate_to_steady_state(dt=0.1, max_steps=7, tolerance=-1.0)
+
+        frequencies = [c["frequency"] for c in analyzer.components.values()]
+        masses = [c["mass"] for c in analyzer.components.values()]
+        reference = KuramotoOscillator(natural_frequencies=frequencies, coupling=0.5)
+        for _ in range(7):
+            reference.step(0.1)
+        _, mean_phase = reference.order_parameter()
+        expected = sum(
+            m * (w ** 2) * math.cos(theta - mean_phase)
+            for m, w, theta in zip(masses, frequencies, reference.phases)
+        )
+
+        self.assertAlmostEqual(analyzer.omega_energy(), expected, places=9)
+
+    def test_omega_energy_tracks_added_components_and_explicit_masses(self) -> None:
+        analyzer = RouterTopologyAnalyzer()
+        analyzer.add_component("a", exit_points=2)
+        self.assertAlmostEqual(analyzer.omega_energy(), 4.0, places=6)
+
+        analyzer.add_component("b", exit_points=3)
+        # Cached weights must be rebuilt: 1.0 * 2^2 + 1.0 * 3^2 = 13
+        self.assertAlmostEqual(analyzer.omega_energy(), 13.0, places=6)
+        # Missing masses default to 1.0: 2.0 * 2^2 + 1.0 * 3^2 = 17
+        self.assertAlmostEqual(analyzer.omega_energy(masses=[2.0]), 17.0, places=6)
+
     def test_analyze_returns_expected_keys(self) -> None:
         analyzer = RouterTopologyAnalyzer()
         analyzer.add_component("router-a", exit_points=5)
@@ -121,6 +260,69 @@ class RouterTopologyAnalyzerTest(unittest.TestCase):
         self.assertIn("is_synchronized", result)
         self.assertIn("phase", result)
 
+    def test_analyze_classifies_synchronized_system_as_crystalline(self) -> None:
+        """Identical components stay phase-locked at r=1, the CRYSTALLINE phase."""
+        analyzer = RouterTopologyAnalyzer()
+        analyzer.add_component("a", exit_points=4)
+        analyzer.add_component("b", exit_points=4)
+
+        result = analyzer.analyze()
+
+        self.assertAlmostEqual(result["coherence"], 1.0, places=6)
+        self.assertEqual(result["phase"], "CRYSTALLINE")
+
+    def test_simulate_to_steady_state_matches_repeated_steps(self) -> None:
+        analyzer = RouterTopologyAnalyzer(coupling=1.5)
+        for name, exit_points in (("a", 1), ("b", 2), ("c", 3), ("d", 5)):
+            analyzer.add_component(name, exit_points=exit_points)
+        frequencies = [c["frequency"] for c in analyzer.components.values()]
+        plain = KuramotoOscillator(natural_frequencies=frequencies, coupling=1.5)
+
+        for _ in range(10):
+            plain.step(0.05)
+        # A negative tolerance is never met, so exactly max_steps steps are taken.
+        steps = analyzer.simulate_to_steady_state(dt=0.05, max_steps=10, tolerance=-1.0)
+
+        _, mean_phase = plain.order_parameter()
+        masses = [c["mass"] for c in analyzer.components.values()]
+        expected_omega = sum(
+            m * (w ** 2) * math.cos(theta - mean_phase)
+            for m, w, theta in zip(masses, frequencies, plain.phases)
+        )
+
+        self.assertEqual(steps, 10)
+        self.assertAlmostEqual(analyzer.coherence(), plain.coherence(), places=12)
+        self.assertAlmostEqual(analyzer.omega_energy(), expected_omega, places=9)
+
+    def test_phase_thresholds_match_comparison_chain(self) -> None:
+        """Boundaries belong to the higher phase, as with the r < 0.3 / r < 0.7 chain."""
+        for r, expected in (
+            (0.0, "CHAOTIC"),
+            (0.2999, "CHAOTIC"),
+            (0.3, "CRITICAL"),
+            (0.6999, "CRITICAL"),
+            (0.7, "CRYSTALLINE"),
+            (1.0, "CRYSTALLINE"),
+        ):
+            self.assertEqual(_PHASE_NAMES[bisect.bisect_right(_PHASE_THRESHOLDS, r)], expected)
+
+    def test_simulate_to_steady_state_with_rk4(self) -> None:
+        analyzer = RouterTopologyAnalyzer(coupling=4.0)
+        analyzer.add_component("a", exit_points=2)
+        analyzer.add_component("b", exit_points=3)
+
+        steps = analyzer.simulate_to_steady_state(dt=0.05, max_steps=500, method="rk4")
+
+        self.assertLess(steps, 500)
+        self.assertGreater(analyzer.coherence(), 0.9)
+
+    def test_simulate_to_steady_state_rejects_unknown_method(self) -> None:
+        analyzer = RouterTopologyAnalyzer()
+        analyzer.add_component("a", exit_points=2)
+
+        with self.assertRaises(ValueError):
+            analyzer.simulate_to_steady_state(method="leapfrog")
+
     def test_optimize_recommendations_for_low_coherence(self) -> None:
         """Low coherence systems should get 'Wire Orphaned Formatters' recommendation."""
         analyzer = RouterTopologyAnalyzer(coupling=0.0)  # No coupling = no sync
@@ -146,6 +348,19 @@ class RouterTopologyAnalyzerTest(unittest.TestCase):
         
         self.assertIn("Consolidate Shared Singletons", interventions)
 
+    def test_high_frequency_outliers_trigger_decomposition_recommendation(self) -> None:
+        """Components far above the mean frequency are named, including ties."""
+        analyzer = RouterTopologyAnalyzer()
+        for name in ("a", "b", "c", "d", "e", "f"):
+            analyzer.add_component(name, exit_points=1)
+        analyzer.add_component("hot-1", exit_points=40)
+        analyzer.add_component("hot-2", exit_points=40)
+
+        recommendations = analyzer.optimize_recommendations()
+        interventions = [r["intervention"] for r in recommendations]
+
+        self.assertIn("Decompose High-Frequency Component: hot-1, hot-2", interventions)
+
 
 if __name__ == "__main__":
     unittest.main()